@@ -1,37 +1,35 @@
 import yaml
 import argparse
+import os
 import sys
-from pathlib import Path
 from pydantic import ValidationError
 from .core.model import Itinerary
 from .core.validation import get_all_checks
-from .ingestion.excel import ExcelIngestion
-from .ingestion.yaml import YAMLIngestion
+from .ingestion.excel import EXCEL_INGESTION
+from .ingestion.yaml import YAML_INGESTION
 
 def load_itinerary(path: str) -> Itinerary:
     """Load itinerary from either Excel (.xlsx) or YAML (.yaml/.yml) file"""
     try:
-        file_path = Path(path)
+        file_ext = os.path.splitext(path)[1].lower()
         
-        if not file_path.exists():
+        if not os.path.isfile(path):
             print(f"Error: File {path} not found.")
             sys.exit(1)
         
         # Determine file type and load accordingly
-        if file_path.suffix.lower() == '.xlsx':
+        if file_ext == '.xlsx':
             print(f"📊 Reading Excel file: {path}")
-            reader = ExcelIngestion()
-            raw_data = reader.parse(path)
+            raw_data = EXCEL_INGESTION.parse(path)
             print("✅ Excel file successfully parsed")
-        elif file_path.suffix.lower() in ['.yaml', '.yml']:
+        elif file_ext in ['.yaml', '.yml']:
             print(f"📄 Reading YAML file: {path}")
-            reader = YAMLIngestion()
-            raw_data = reader.parse(path)
+            raw_data = YAML_INGESTION.parse(path)
         else:
             print(f"Error: Unsupported file type. Please use .xlsx, .yaml, or .yml files.")
             sys.exit(1)
         
-        return Itinerary(**raw_data)
+        return Itinerary.model_validate(raw_data)
         
     except FileNotFoundError:
         print(f"Error: File {path} not found.")
@@ -43,36 +41,45 @@ def load_itinerary(path: str) -> Itinerary:
         print(f"Error processing file: {e}")
         sys.exit(1)
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Travel Readiness Sentinel")
     parser.add_argument('--itinerary', required=True, 
                        help="Path to trip file (Excel .xlsx or YAML .yaml/.yml)")
     parser.add_argument('--output', 
                        help="Output YAML file (only when input is Excel)")
-    args = parser.parse_args()
+    parser.add_argument('--fail-fast', action='store_true',
+                       help="Stop at the first failed check")
+    args = parser.parse_args(argv)
 
     print("🔍 Ingesting Itinerary Data...")
     itinerary = load_itinerary(args.itinerary)
     
-    print(f"✈️  Validating Trip to {itinerary.trip_details.destination}...")
-    print("-" * 50)
-
     checks = get_all_checks()
     failures = 0
 
+    # Collect report lines and emit them in one write
+    lines = [
+        f"✈️  Validating Trip to {itinerary.trip_details.destination}...",
+        "-" * 50,
+    ]
     for check in checks:
         result = check.run(itinerary)
         if result.passed:
-            print(f"✅ [PASS] {result.check_name}")
+            lines.append(f"✅ [PASS] {result.check_name}")
         else:
-            print(f"❌ [FAIL] {result.check_name}: {result.message}")
+            lines.append(f"❌ [FAIL] {result.check_name}: {result.message}")
             failures += 1
+            if args.fail_fast:
+                break
 
-    print("-" * 50)
+    lines.append("-" * 50)
     if failures == 0:
-        print("🎉 TRSS Status: READY FOR DEPARTURE")
+        lines.append("🎉 TRSS Status: READY FOR DEPARTURE")
     else:
-        print(f"🚨 TRSS Status: GROUNDED ({failures} Critical Errors Found)")
+        lines.append(f"🚨 TRSS Status: GROUNDED ({failures} Critical Errors Found)")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    if failures:
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -6,17 +6,18 @@ from fastapi import FastAPI, HTTPException, UploadFile, File, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError as PydanticValidationError
-from pathlib import Path
-import tempfile
+from starlette.concurrency import run_in_threadpool
+from datetime import datetime
+import os
 import yaml
 import time
-from typing import Union
+from typing import List, Union
 
-from .config import settings
+from .config import settings, ENABLE_METRICS, ALLOWED_FILE_EXTENSIONS
 from .core.model import Itinerary
-from .core.validation import run_all_checks
-from .ingestion.excel import ExcelIngestion
-from .ingestion.yaml import YAMLIngestion
+from .core.validation import CheckResult, run_all_checks
+from .ingestion.excel import EXCEL_INGESTION
+from .ingestion.yaml import YAML_INGESTION
 from .core.schemas import (
     ValidationResponse,
     ValidationCheckResult,
@@ -26,11 +27,37 @@ from .core.schemas import (
 )
 from .logging_config import setup_logging, logger
 from .middleware import LoggingMiddleware
-from .metrics import metrics, get_metrics
+from .metrics import (
+    get_metrics,
+    record_file_upload,
+    record_validation_checks,
+    record_validation_request,
+    set_app_version
+)
+
+
+# Application startup time for uptime tracking (monotonic, so unaffected
+# by wall-clock adjustments)
+app_start_time = time.monotonic()
+
+# Static part of the /health payload; only timestamp and uptime vary
+_HEALTH_CHECKS = {
+    "api": "operational",
+    "validation_engine": "operational"
+}
+if ENABLE_METRICS:
+    _HEALTH_CHECKS["metrics"] = "operational"
 
+# Upload error message, fixed for the process
+_UNSUPPORTED_DETAIL_TEMPLATE = "Unsupported file type: {}. Allowed: " + ", ".join(sorted(ALLOWED_FILE_EXTENSIONS))
+_MAX_UPLOAD_BYTES = settings.max_upload_size_mb * 1024 * 1024
 
-# Application startup time for uptime tracking
-app_start_time = time.time()
+# File extension -> shared ingestor
+_INGESTORS = {
+    '.xlsx': EXCEL_INGESTION,
+    '.yaml': YAML_INGESTION,
+    '.yml': YAML_INGESTION,
+}
 
 # Initialize logging
 setup_logging(log_level=settings.log_level, log_format=settings.log_format)
@@ -55,15 +82,51 @@ app.add_middleware(
 )
 
 # Add logging middleware
-if settings.enable_metrics:
+if ENABLE_METRICS:
     app.add_middleware(LoggingMiddleware)
     logger.info("Logging middleware enabled")
 
 # Set application version in metrics
-if settings.enable_metrics:
-    metrics.set_app_version(settings.app_version)
+if ENABLE_METRICS:
+    set_app_version(settings.app_version)
     logger.info("Metrics collection enabled")
 
+# Make deployments without libyaml visible; YAML uploads still work but
+# fall back to the slower pure-Python parser
+if yaml.__with_libyaml__:
+    logger.info("libyaml C loader enabled for YAML ingestion")
+else:
+    logger.warning("libyaml not available, YAML ingestion uses the pure-Python loader")
+
+
+def build_validation_response(itinerary: Itinerary, check_results: List[CheckResult]) -> ValidationResponse:
+    """
+    Convert check results to the API schema and tally the summary
+    in a single pass over the results.
+    
+    The inputs are produced internally, so models are built with
+    model_construct; FastAPI still checks the response_model on output.
+    """
+    api_checks = []
+    passed_count = 0
+    for result in check_results:
+        api_checks.append(ValidationCheckResult.model_construct(
+            check_name=result.check_name,
+            passed=result.passed,
+            message=result.message
+        ))
+        passed_count += result.passed
+    failed_count = len(check_results) - passed_count
+    
+    return ValidationResponse.model_construct(
+        status="success" if failed_count == 0 else "failed",
+        destination=itinerary.trip_details.destination,
+        total_checks=len(check_results),
+        passed_checks=passed_count,
+        failed_checks=failed_count,
+        checks=api_checks
+    )
+
 
 # Exception handlers
 @app.exception_handler(PydanticValidationError)
@@ -112,27 +175,15 @@ async def health_check():
     Health check endpoint for monitoring and load balancers.
     Returns service status, version information, and basic metrics.
     """
-    uptime_seconds = int(time.time() - app_start_time)
-    
-    checks = {
-        "api": "operational",
-        "validation_engine": "operational"
-    }
-    
-    if settings.enable_metrics:
-        checks["metrics"] = "operational"
-    
-    response = HealthResponse(
-        status="ok",
-        version=settings.app_version,
-        checks=checks
-    )
-    
-    # Add uptime to response (not in schema, but useful)
-    response_dict = response.model_dump()
-    response_dict["uptime_seconds"] = uptime_seconds
-    
-    return response_dict
+    # Return the payload directly so it is serialized once, without a
+    # model build/dump/re-validate round trip on this frequently polled path
+    return JSONResponse({
+        "status": "ok",
+        "version": settings.app_version,
+        "timestamp": datetime.utcnow().isoformat(),
+        "checks": _HEALTH_CHECKS,
+        "uptime_seconds": int(time.monotonic() - app_start_time)
+    })
 
 
 @app.get("/metrics")
@@ -146,7 +197,7 @@ async def metrics_endpoint():
     - Validation check results
     - File upload statistics
     """
-    if not settings.enable_metrics:
+    if not ENABLE_METRICS:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Metrics collection is disabled"
@@ -196,33 +247,11 @@ async def validate_itinerary(itinerary: Itinerary):
     check_results = run_all_checks(itinerary)
     
     # Record metrics for each check
-    if settings.enable_metrics:
-        metrics.record_validation_request("json")
-        for result in check_results:
-            metrics.record_validation_check(result.check_name, result.passed)
+    if ENABLE_METRICS:
+        record_validation_request("json")
+        record_validation_checks(check_results)
     
-    # Convert to API schema
-    api_checks = [
-        ValidationCheckResult(
-            check_name=result.check_name,
-            passed=result.passed,
-            message=result.message
-        )
-        for result in check_results
-    ]
-    
-    # Calculate summary
-    passed_count = sum(1 for r in check_results if r.passed)
-    failed_count = len(check_results) - passed_count
-    
-    return ValidationResponse(
-        status="success" if failed_count == 0 else "failed",
-        destination=itinerary.trip_details.destination,
-        total_checks=len(check_results),
-        passed_checks=passed_count,
-        failed_checks=failed_count,
-        checks=api_checks
-    )
+    return build_validation_response(itinerary, check_results)
 
 
 @app.post("/upload", response_model=ValidationResponse)
@@ -239,74 +268,43 @@ async def upload_and_validate(
     - Excel: Use the template format with Field/Value columns
     - YAML: Standard itinerary structure
     """
-    # Validate file extension
-    file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in settings.allowed_file_extensions:
+    # Validate file extension; an allowed extension without an ingestor
+    # is rejected the same way rather than failing later
+    file_ext = os.path.splitext(file.filename or '')[1].lower()
+    reader = _INGESTORS.get(file_ext) if file_ext in ALLOWED_FILE_EXTENSIONS else None
+    if reader is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type: {file_ext}. Allowed: {settings.allowed_file_extensions}"
+            detail=_UNSUPPORTED_DETAIL_TEMPLATE.format(file_ext)
         )
     
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-        # Write uploaded content to temp file
-        content = await file.read()
-        temp_file.write(content)
-        temp_path = temp_file.name
-    
-    try:
-        # Parse file based on extension
-        if file_ext == '.xlsx':
-            reader = ExcelIngestion()
-            raw_data = reader.parse(temp_path)
-            source_type = "excel"
-        elif file_ext in ['.yaml', '.yml']:
-            reader = YAMLIngestion()
-            raw_data = reader.parse(temp_path)
-            source_type = "yaml"
-        else:
-            raise ValueError(f"Unsupported file extension: {file_ext}")
-        
-        # Create Itinerary object (will validate via Pydantic)
-        itinerary = Itinerary(**raw_data)
-        
-        # Run validation checks
-        check_results = run_all_checks(itinerary)
-        
-        # Record metrics
-        if settings.enable_metrics:
-            metrics.record_validation_request(source_type)
-            metrics.record_file_upload(file_ext.lstrip('.'), success=True)
-            for result in check_results:
-                metrics.record_validation_check(result.check_name, result.passed)
-        
-        # Convert to API schema
-        api_checks = [
-            ValidationCheckResult(
-                check_name=result.check_name,
-                passed=result.passed,
-                message=result.message
-            )
-            for result in check_results
-        ]
-        
-        # Calculate summary
-        passed_count = sum(1 for r in check_results if r.passed)
-        failed_count = len(check_results) - passed_count
-        
-        return ValidationResponse(
-            status="success" if failed_count == 0 else "failed",
-            destination=itinerary.trip_details.destination,
-            total_checks=len(check_results),
-            passed_checks=passed_count,
-            failed_checks=failed_count,
-            checks=api_checks
+    # Enforce the configured upload size limit
+    if file.size is not None and file.size > _MAX_UPLOAD_BYTES:
+        # Literal 413: the status constant was renamed across Starlette
+        # releases, and requirements.txt still allows the older name only
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum upload size is {settings.max_upload_size_mb} MB"
         )
     
-    finally:
-        # Clean up temporary file
-        Path(temp_path).unlink(missing_ok=True)
-
+    # Parse the spooled upload stream directly; both parsers accept
+    # file objects, so no temporary file is needed. Parsing is blocking,
+    # so it runs in the threadpool to keep the event loop free
+    raw_data = await run_in_threadpool(reader.parse, file.file)
+    
+    # Create Itinerary object (will validate via Pydantic)
+    itinerary = Itinerary.model_validate(raw_data)
+    
+    # Run validation checks
+    check_results = run_all_checks(itinerary)
+    
+    # Record metrics
+    if ENABLE_METRICS:
+        record_validation_request(reader.source_type)
+        record_file_upload(file_ext.lstrip('.'), success=True)
+        record_validation_checks(check_results)
+    
+    return build_validation_response(itinerary, check_results)
 
 if __name__ == "__main__":
     import uvicorn
@@ -314,5 +312,9 @@ if __name__ == "__main__":
         "src.api:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        workers=settings.workers,
+        # LoggingMiddleware already logs every request when it is mounted;
+        # otherwise keep uvicorn's access log so requests are still logged
+        access_log=settings.debug or not ENABLE_METRICS
     )
@@ -3,7 +3,7 @@ Configuration management for Travel Readiness Sentinel API.
 Uses Pydantic Settings for environment-based configuration.
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import FrozenSet, List
 
 
 class Settings(BaseSettings):
@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
+    workers: int = 1  # metrics are per-process, so >1 splits /metrics counters
     
     # CORS Configuration
     cors_origins: List[str] = ["*"]
@@ -27,7 +28,7 @@ class Settings(BaseSettings):
     
     # File Upload Limits
     max_upload_size_mb: int = 10
-    allowed_file_extensions: List[str] = [".xlsx", ".yaml", ".yml"]
+    allowed_file_extensions: FrozenSet[str] = frozenset({".xlsx", ".yaml", ".yml"})
     
     # Observability Configuration
     log_level: str = "INFO"
@@ -43,3 +44,8 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
+
+# Hot-path settings bound once at import, so request handlers read plain
+# module constants instead of going through the Settings object
+ENABLE_METRICS = settings.enable_metrics
+ALLOWED_FILE_EXTENSIONS = frozenset(ext.lower() for ext in settings.allowed_file_extensions)
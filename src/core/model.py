@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Literal, Union
+from typing import ClassVar, Dict, List, Literal, Tuple, Union
 from datetime import date
 
 class Flight(BaseModel):
@@ -8,16 +8,19 @@ class Flight(BaseModel):
     arrival_date: Union[date, None] = None
     departure_date: Union[date, None] = None
     
+    # Per flight type: (required date field, forbidden date field)
+    _FLIGHT_RULES: ClassVar[Dict[str, Tuple[str, str]]] = {
+        'arrival': ('arrival_date', 'departure_date'),
+        'departure': ('departure_date', 'arrival_date'),
+    }
+    
     @model_validator(mode='after')
     def validate_flight_date(self):
-        if self.type == 'arrival' and self.arrival_date is None:
-            raise ValueError('Arrival flights must have arrival_date')
-        if self.type == 'departure' and self.departure_date is None:
-            raise ValueError('Departure flights must have departure_date')
-        if self.type == 'arrival' and self.departure_date is not None:
-            raise ValueError('Arrival flights should not have departure_date')
-        if self.type == 'departure' and self.arrival_date is not None:
-            raise ValueError('Departure flights should not have arrival_date')
+        required, forbidden = self._FLIGHT_RULES[self.type]
+        if getattr(self, required) is None:
+            raise ValueError(f'{self.type.capitalize()} flights must have {required}')
+        if getattr(self, forbidden) is not None:
+            raise ValueError(f'{self.type.capitalize()} flights should not have {forbidden}')
         return self
     
     @property
@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Literal
 from datetime import datetime
 
+# Timestamp factory shared by the response models (naive UTC)
+_utcnow = datetime.utcnow
+
 
 class ValidationCheckResult(BaseModel):
     """Result of a single validation check."""
@@ -22,7 +25,7 @@ class ValidationResponse(BaseModel):
     passed_checks: int = Field(..., description="Number of checks that passed")
     failed_checks: int = Field(..., description="Number of checks that failed")
     checks: List[ValidationCheckResult] = Field(..., description="Detailed check results")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Validation timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Validation timestamp")
 
 
 class ValidationErrorResponse(BaseModel):
@@ -30,15 +33,16 @@ class ValidationErrorResponse(BaseModel):
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
     details: Optional[dict] = Field(None, description="Additional error details")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class HealthResponse(BaseModel):
     """Health check response."""
     status: Literal["ok", "degraded", "down"] = Field(..., description="Service health status")
     version: str = Field(..., description="API version")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     checks: Optional[dict] = Field(None, description="Individual health check results")
+    uptime_seconds: Optional[int] = Field(None, description="Seconds since the API process started")
 
 
 class APIInfoResponse(BaseModel):
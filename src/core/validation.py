@@ -3,8 +3,8 @@ Validation checks for travel itinerary readiness.
 Refactored to return structured results for both CLI and API usage.
 """
 from dataclasses import dataclass
-from typing import List
-from .model import Itinerary
+from typing import Dict, List, Optional
+from .model import Flight, Itinerary
 
 
 @dataclass
@@ -15,6 +15,22 @@ class CheckResult:
     message: str
 
 
+def index_flights(data: Itinerary) -> Dict[str, Flight]:
+    """Map each flight type to its first flight in the itinerary."""
+    flights_by_type = {}
+    for flight in data.flights:
+        flights_by_type.setdefault(flight.type, flight)
+    return flights_by_type
+
+
+def _find_flight(data: Itinerary, flight_type: str,
+                 flights_by_type: Optional[Dict[str, Flight]]) -> Flight:
+    """Look up a flight by type, scanning the itinerary if no index is given."""
+    if flights_by_type is not None:
+        return flights_by_type[flight_type]
+    return next(f for f in data.flights if f.type == flight_type)
+
+
 class ReadinessCheck:
     """
     Base class for all checks. 
@@ -23,8 +39,13 @@ class ReadinessCheck:
     def __init__(self, name: str):
         self.name = name
 
-    def run(self, data: Itinerary) -> CheckResult:
-        """Run the check and return structured result."""
+    def run(self, data: Itinerary,
+            flights_by_type: Optional[Dict[str, Flight]] = None) -> CheckResult:
+        """
+        Run the check and return structured result.
+        flights_by_type is an optional index from index_flights, shared
+        when several checks run against the same itinerary.
+        """
         raise NotImplementedError
 
 
@@ -32,8 +53,9 @@ class ArrivalAlignmentCheck(ReadinessCheck):
     """
     Check 1: Does flight arrival match hotel check-in?
     """
-    def run(self, data: Itinerary) -> CheckResult:
-        arrival_flight = next(f for f in data.flights if f.type == 'arrival')
+    def run(self, data: Itinerary,
+            flights_by_type: Optional[Dict[str, Flight]] = None) -> CheckResult:
+        arrival_flight = _find_flight(data, 'arrival', flights_by_type)
         
         if arrival_flight.flight_date == data.accommodation.check_in:
             return CheckResult(
@@ -53,7 +75,8 @@ class DurationCoverageCheck(ReadinessCheck):
     """
     Check 2: Does the hotel cover the full trip duration?
     """
-    def run(self, data: Itinerary) -> CheckResult:
+    def run(self, data: Itinerary,
+            flights_by_type: Optional[Dict[str, Flight]] = None) -> CheckResult:
         trip_days = data.trip_details.total_duration_days
         hotel_days = data.accommodation.stay_duration
         
@@ -75,8 +98,9 @@ class DepartureAlignmentCheck(ReadinessCheck):
     """
     Check 3: Does departure flight match trip end date?
     """
-    def run(self, data: Itinerary) -> CheckResult:
-        dept_flight = next(f for f in data.flights if f.type == 'departure')
+    def run(self, data: Itinerary,
+            flights_by_type: Optional[Dict[str, Flight]] = None) -> CheckResult:
+        dept_flight = _find_flight(data, 'departure', flights_by_type)
         
         if dept_flight.flight_date == data.trip_details.end_date:
             return CheckResult(
@@ -92,13 +116,18 @@ class DepartureAlignmentCheck(ReadinessCheck):
             )
 
 
+# Checks hold no per-itinerary state, so one set of instances is shared
+# across every run instead of being rebuilt per request.
+_CHECKS = (
+    ArrivalAlignmentCheck("Arrival Date Alignment"),
+    DurationCoverageCheck("Full Accommodation Coverage"),
+    DepartureAlignmentCheck("Exit Strategy Alignment")
+)
+
+
 def get_all_checks() -> List[ReadinessCheck]:
     """Get all validation checks."""
-    return [
-        ArrivalAlignmentCheck("Arrival Date Alignment"),
-        DurationCoverageCheck("Full Accommodation Coverage"),
-        DepartureAlignmentCheck("Exit Strategy Alignment")
-    ]
+    return list(_CHECKS)
 
 
 def run_all_checks(itinerary: Itinerary) -> List[CheckResult]:
@@ -106,5 +135,6 @@ def run_all_checks(itinerary: Itinerary) -> List[CheckResult]:
     Run all validation checks and return structured results.
     Useful for API endpoints.
     """
-    checks = get_all_checks()
-    return [check.run(itinerary) for check in checks]
\ No newline at end of file
+    flights_by_type = index_flights(itinerary)
+    return [check.run(itinerary, flights_by_type) for check in _CHECKS]
+
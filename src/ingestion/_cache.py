@@ -0,0 +1,78 @@
+"""
+Result caching for ingestion sources.
+Re-parsing an unchanged file or a byte-identical upload returns the
+previous result instead of reading the source again.
+"""
+import copy
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+# Maximum number of parsed sources kept per ingestion class
+CACHE_SIZE = 64
+
+# Read size when hashing file objects, so uploads are never copied whole
+_HASH_CHUNK_SIZE = 64 * 1024
+
+
+def cached_parse(parse: Callable[[Any, Any], Dict[str, Any]]) -> Callable[[Any, Any], Dict[str, Any]]:
+    """
+    Memoize an IngestionSource.parse implementation.
+
+    File paths are keyed on (absolute path, mtime, size) so edits
+    invalidate the entry; seekable file objects are hashed in chunks,
+    rewound and passed to the parser unchanged, so uploads are never
+    copied into memory. Text and non-seekable streams are parsed without
+    caching. Callers always receive a deep copy, so mutating the returned
+    dict never corrupts the cache. Failed parses are not cached.
+    """
+    cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(parse)
+    def wrapper(self, source):
+        if hasattr(source, 'read'):
+            if not (hasattr(source, 'seekable') and source.seekable()):
+                # Hashing would consume a one-shot stream
+                return parse(self, source)
+            start = source.tell()
+            chunk = source.read(_HASH_CHUNK_SIZE)
+            if not isinstance(chunk, bytes):
+                # Text streams are parsed as usual, just not cached
+                source.seek(start)
+                return parse(self, source)
+            digest = hashlib.blake2b(digest_size=16)
+            while chunk:
+                digest.update(chunk)
+                chunk = source.read(_HASH_CHUNK_SIZE)
+            source.seek(start)
+            key = ('bytes', digest.digest())
+        else:
+            try:
+                stat = os.stat(source)
+            except OSError:
+                # Let the parser report missing/unreadable files as usual
+                return parse(self, source)
+            # Absolute, so one relative name used from different working
+            # directories cannot hit another file's entry
+            key = ('path', os.path.abspath(source), stat.st_mtime_ns, stat.st_size)
+
+        with lock:
+            data = cache.get(key)
+            if data is not None:
+                cache.move_to_end(key)
+
+        if data is None:
+            data = parse(self, source)
+            with lock:
+                cache[key] = data
+                if len(cache) > CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return copy.deepcopy(data)
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
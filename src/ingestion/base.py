@@ -3,7 +3,8 @@ Abstract base class for all itinerary ingestion sources.
 Provides a consistent interface for parsing different input formats.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, BinaryIO, Union
 
 
 class IngestionSource(ABC):
@@ -16,12 +17,13 @@ class IngestionSource(ABC):
     """
     
     @abstractmethod
-    def parse(self, source: Any) -> Dict[str, Any]:
+    def parse(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
         """
         Parse the input source and return raw itinerary data.
         
         Args:
-            source: Input source (file path, file object, string, etc.)
+            source: File path or an open binary file object (e.g. an
+                upload stream), so callers never need a temporary file
         
         Returns:
             Dictionary containing itinerary data in the expected schema format
@@ -2,43 +2,117 @@
 Excel file ingestion for travel itineraries.
 Reads Excel files and converts them to standardized itinerary format.
 """
-import pandas as pd
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO, Callable, ClassVar, List, Sequence, Tuple, Union
 
+from ._cache import cached_parse
 from .base import IngestionSource
 
+# Prefer the calamine (Rust) xlsx reader; fall back to openpyxl when
+# python-calamine is not installed.
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+
+def _clean_value(value: Any) -> Any:
+    """
+    Normalize a cell value. Strings are stripped and datetime cells reduced
+    to their date; other scalars are stringified since the model's text
+    fields do not accept numbers.
+    """
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return str(value)
+
+
+def _clean_date(value: Any) -> Any:
+    """
+    Normalize a date cell, parsing ISO strings here so the model receives
+    a date instead of re-parsing the text. Anything unparseable is passed
+    on unchanged for the model to reject with its usual error.
+    """
+    value = _clean_value(value)
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+# Model fields that hold dates
+_DATE_FIELDS = frozenset({
+    'start_date', 'end_date', 'arrival_date', 'departure_date', 'check_in', 'check_out'
+})
+
+
+def _make_setter(path: Tuple[str, ...]) -> Callable[[Dict[str, Any], Any], None]:
+    """Build the function that stores a cell value at the given mapping path."""
+    section, key = path[0], path[-1]
+    clean = _clean_date if key in _DATE_FIELDS else _clean_value
+    
+    if section == 'flights':
+        flight_type = path[1]
+        
+        def set_flight_value(data: Dict[str, Any], value: Any):
+            # Flights are collected per type and formatted as a list later
+            flight = data.setdefault(flight_type, {})
+            flight[key] = clean(value)
+            flight['type'] = flight_type
+        return set_flight_value
+    
+    if key == 'total_duration_days':
+        def set_int_value(data: Dict[str, Any], value: Any):
+            data[section][key] = int(value)
+        return set_int_value
+    
+    def set_value(data: Dict[str, Any], value: Any):
+        data[section][key] = clean(value)
+    return set_value
+
 
 class ExcelIngestion(IngestionSource):
     """Reads travel itinerary data from Excel files."""
     
-    def __init__(self):
-        self.field_mapping = {
-            'Trip Destination': ('trip_details', 'destination'),
-            'Trip Start Date': ('trip_details', 'start_date'),
-            'Trip End Date': ('trip_details', 'end_date'),
-            'Total Duration (Days)': ('trip_details', 'total_duration_days'),
-            'Arrival Flight Number': ('flights', 'arrival', 'flight_number'),
-            'Arrival Date': ('flights', 'arrival', 'arrival_date'),
-            'Departure Flight Number': ('flights', 'departure', 'flight_number'),
-            'Departure Date': ('flights', 'departure', 'departure_date'),
-            'Hotel Name': ('accommodation', 'hotel_name'),
-            'Hotel Check-in Date': ('accommodation', 'check_in'),
-            'Hotel Check-out Date': ('accommodation', 'check_out')
-        }
+    field_mapping: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'Trip Destination': ('trip_details', 'destination'),
+        'Trip Start Date': ('trip_details', 'start_date'),
+        'Trip End Date': ('trip_details', 'end_date'),
+        'Total Duration (Days)': ('trip_details', 'total_duration_days'),
+        'Arrival Flight Number': ('flights', 'arrival', 'flight_number'),
+        'Arrival Date': ('flights', 'arrival', 'arrival_date'),
+        'Departure Flight Number': ('flights', 'departure', 'flight_number'),
+        'Departure Date': ('flights', 'departure', 'departure_date'),
+        'Hotel Name': ('accommodation', 'hotel_name'),
+        'Hotel Check-in Date': ('accommodation', 'check_in'),
+        'Hotel Check-out Date': ('accommodation', 'check_out')
+    }
+    
+    # Field label -> setter, resolved once so rows dispatch with one lookup
+    _FIELD_SETTERS: ClassVar[Dict[str, Callable[[Dict[str, Any], Any], None]]] = {
+        field: _make_setter(path) for field, path in field_mapping.items()
+    }
     
     @property
     def source_type(self) -> str:
         """Return source type identifier."""
         return "excel"
     
-    def parse(self, source: str) -> Dict[str, Any]:
+    @cached_parse
+    def parse(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
         """
         Parse Excel file and return itinerary data.
         
         Args:
-            source: Path to Excel file
+            source: Path to Excel file (string or Path object) or an open
+                binary file object
         
         Returns:
             Dictionary containing itinerary data
@@ -47,7 +121,7 @@ class ExcelIngestion(IngestionSource):
             ValueError: If file cannot be read or data is invalid
         """
         try:
-            df = pd.read_excel(source, sheet_name='Travel Itinerary')
+            rows = self._read_rows(source)
         except Exception as e:
             raise ValueError(f"Failed to read Excel file: {e}")
         
@@ -58,17 +132,32 @@ class ExcelIngestion(IngestionSource):
             'accommodation': {}
         }
         
+        # Locate the Field/Value columns from the header row
+        header = rows[0] if rows else ()
+        if 'Field' in header and 'Value' in header:
+            field_idx = header.index('Field')
+            value_idx = header.index('Value')
+            body = rows[1:]
+        else:
+            body = []
+        
         # Process each row
-        for _, row in df.iterrows():
-            field = str(row.get('Field', '')).strip()
-            value = row.get('Value', '')
+        for row in body:
+            field = row[field_idx] if field_idx < len(row) else None
+            value = row[value_idx] if value_idx < len(row) else None
+            field = '' if field is None else str(field).strip()
+            
+            # calamine reports every number as float; keep whole numbers as int
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
             
             # Skip empty fields or rows
-            if not field or pd.isna(value) or str(value).strip() == '':
+            if not field or value is None or (isinstance(value, str) and not value.strip()):
                 continue
                 
-            if field in self.field_mapping:
-                self._set_nested_value(data, field, value)
+            setter = self._FIELD_SETTERS.get(field)
+            if setter is not None:
+                setter(data, value)
         
         # Validate required fields
         self._validate_data(data)
@@ -78,25 +167,26 @@ class ExcelIngestion(IngestionSource):
         
         return data
     
-    def _set_nested_value(self, data: Dict[str, Any], field: str, value: Any):
-        """Set nested dictionary value based on field mapping."""
-        path = self.field_mapping[field]
-        
-        if path[0] == 'trip_details':
-            if path[1] == 'total_duration_days':
-                data['trip_details'][path[1]] = int(value)
-            else:
-                data['trip_details'][path[1]] = str(value).strip()
-                
-        elif path[0] == 'flights':
-            # Initialize flight type if not exists
-            if path[1] not in data:
-                data[path[1]] = {}
-            data[path[1]][path[2]] = str(value).strip()
-            data[path[1]]['type'] = path[1]
-            
-        elif path[0] == 'accommodation':
-            data['accommodation'][path[1]] = str(value).strip()
+    def _read_rows(self, source: Union[str, Path, BinaryIO]) -> List[Sequence[Any]]:
+        """Read every row of the itinerary sheet as a sequence of cell values."""
+        if CalamineWorkbook is not None:
+            workbook = CalamineWorkbook.from_object(source)
+            # Keep leading blank rows/columns, as openpyxl does, so both
+            # readers see the same grid
+            return workbook.get_sheet_by_name('Travel Itinerary').to_python(skip_empty_area=False)
+        
+        # openpyxl (and the numpy it pulls in) is only imported when needed,
+        # keeping it off the API's startup path
+        from openpyxl import load_workbook
+        
+        # Values-only streaming read: formulas resolve to their cached
+        # values and styles/links are skipped, which is all a Field/Value
+        # template needs
+        workbook = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+        try:
+            return list(workbook['Travel Itinerary'].iter_rows(values_only=True))
+        finally:
+            workbook.close()
     
     def _format_flights(self, data: Dict[str, Any]):
         """Convert flight dictionaries to proper list format."""
@@ -138,6 +228,9 @@ class ExcelIngestion(IngestionSource):
             raise ValueError("Missing departure flight information")
 
 
+# Shared instance; the ingestor holds no per-file state
+EXCEL_INGESTION = ExcelIngestion()
+
 # Backward compatibility alias
 ExcelItineraryReader = ExcelIngestion
 
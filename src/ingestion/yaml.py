@@ -4,10 +4,18 @@ Reads YAML files and converts them to standardized itinerary format.
 """
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Union, BinaryIO
 
+from ._cache import cached_parse
 from .base import IngestionSource
 
+# Prefer the libyaml C parser; fall back to the pure-Python loader when
+# PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class YAMLIngestion(IngestionSource):
     """Reads travel itinerary data from YAML files."""
@@ -17,12 +25,14 @@ class YAMLIngestion(IngestionSource):
         """Return source type identifier."""
         return "yaml"
     
-    def parse(self, source: Union[str, Path]) -> Dict[str, Any]:
+    @cached_parse
+    def parse(self, source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
         """
         Parse YAML file and return itinerary data.
         
         Args:
-            source: Path to YAML file (string or Path object)
+            source: Path to YAML file (string or Path object) or an open
+                binary file object
         
         Returns:
             Dictionary containing itinerary data
@@ -31,8 +41,12 @@ class YAMLIngestion(IngestionSource):
             ValueError: If file cannot be read or YAML is invalid
         """
         try:
-            with open(source, 'r') as f:
-                data = yaml.safe_load(f)
+            if hasattr(source, 'read'):
+                data = yaml.load(source, Loader=SafeLoader)
+            else:
+                # Read as bytes so the loader handles UTF-8 decoding itself
+                with open(source, 'rb') as f:
+                    data = yaml.load(f, Loader=SafeLoader)
         except FileNotFoundError:
             raise ValueError(f"YAML file not found: {source}")
         except yaml.YAMLError as e:
@@ -45,3 +59,6 @@ class YAMLIngestion(IngestionSource):
         
         return data
 
+
+# Shared instance; the ingestor holds no per-file state
+YAML_INGESTION = YAMLIngestion()
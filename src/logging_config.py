@@ -6,12 +6,25 @@ import logging
 import sys
 from pythonjsonlogger import jsonlogger
 from typing import Optional
-import uuid
+import itertools
+import secrets
 from contextvars import ContextVar
 
+# orjson serializes log records much faster than the stdlib json module;
+# fall back to python-json-logger's default serializer when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Context variable for request ID tracking
 request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 
+# Request IDs are a per-process counter mixed with a random seed: unique
+# within the process and cheaper than a uuid4 per request
+_REQUEST_ID_SEED = secrets.randbits(64)
+_request_id_counter = itertools.count()
+
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """
@@ -34,6 +47,20 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         request_id = request_id_var.get()
         if request_id:
             log_record['request_id'] = request_id
+    
+    def jsonify_log_record(self, log_record):
+        """Serialize the log record, using orjson when it is installed."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    log_record,
+                    default=str,
+                    option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+                ).decode()
+            except TypeError:
+                # e.g. non-string keys; let the stdlib serializer handle it
+                pass
+        return super(CustomJsonFormatter, self).jsonify_log_record(log_record)
 
 
 def setup_logging(log_level: str = "INFO", log_format: str = "json") -> logging.Logger:
@@ -80,13 +107,14 @@ def set_request_id(request_id: str = None) -> str:
     Set request ID for current context.
     
     Args:
-        request_id: Optional request ID. If not provided, generates a new UUID.
+        request_id: Optional request ID. If not provided, generates a new
+            16-character hex ID.
     
     Returns:
         The request ID that was set
     """
     if request_id is None:
-        request_id = str(uuid.uuid4())
+        request_id = f"{_REQUEST_ID_SEED ^ next(_request_id_counter):016x}"
     
     request_id_var.set(request_id)
     return request_id
@@ -5,6 +5,8 @@ Tracks request counts, latency, validation results, and file uploads.
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 from prometheus_client import CollectorRegistry
 from fastapi import Response
+from typing import Iterable
+import functools
 import time
 
 # Create a custom registry to avoid conflicts
@@ -56,83 +58,118 @@ app_info = Gauge(
     registry=registry
 )
 
+# Label values used on hot paths
+_PASS, _FAIL = "pass", "fail"
+_SUCCESS, _ERROR = "success", "error"
 
-class MetricsCollector:
-    """Helper class for collecting metrics throughout the application."""
+# Labelled children are cached so repeat label combinations skip
+# prometheus_client's label validation and lookup
+_LABEL_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_LABEL_CACHE_SIZE)
+def _request_counter(method: str, endpoint: str, status_code: str):
+    return http_requests_total.labels(method, endpoint, status_code)
+
+
+@functools.lru_cache(maxsize=_LABEL_CACHE_SIZE)
+def _request_histogram(method: str, endpoint: str):
+    return http_request_duration_seconds.labels(method, endpoint)
+
+
+@functools.lru_cache(maxsize=_LABEL_CACHE_SIZE)
+def _validation_check_counter(check_name: str, result: str):
+    return validation_checks_total.labels(check_name, result)
+
+
+@functools.lru_cache(maxsize=None)
+def _validation_request_counter(source_type: str):
+    return validation_requests_total.labels(source_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _file_upload_counter(file_type: str, status: str):
+    return file_uploads_total.labels(file_type, status)
+
+
+def record_request(method: str, endpoint: str, status_code: int, duration: float):
+    """
+    Record HTTP request metrics.
     
-    @staticmethod
-    def record_request(method: str, endpoint: str, status_code: int, duration: float):
-        """
-        Record HTTP request metrics.
-        
-        Args:
-            method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint path
-            status_code: HTTP status code
-            duration: Request duration in seconds
-        """
-        http_requests_total.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=str(status_code)
-        ).inc()
-        
-        http_request_duration_seconds.labels(
-            method=method,
-            endpoint=endpoint
-        ).observe(duration)
+    Args:
+        method: HTTP method (GET, POST, etc.)
+        endpoint: Matched route template (e.g. "/validate"), or "unmatched"
+        status_code: HTTP status code
+        duration: Request duration in seconds
+    """
+    _request_counter(method, endpoint, str(status_code)).inc()
+    _request_histogram(method, endpoint).observe(duration)
+
+
+def record_validation_check(check_name: str, passed: bool):
+    """
+    Record validation check result.
     
-    @staticmethod
-    def record_validation_check(check_name: str, passed: bool):
-        """
-        Record validation check result.
-        
-        Args:
-            check_name: Name of the validation check
-            passed: Whether the check passed
-        """
-        result = "pass" if passed else "fail"
-        validation_checks_total.labels(
-            check_name=check_name,
-            result=result
-        ).inc()
+    Args:
+        check_name: Name of the validation check
+        passed: Whether the check passed
+    """
+    _validation_check_counter(check_name, _PASS if passed else _FAIL).inc()
+
+
+def record_validation_checks(results: Iterable):
+    """
+    Record a batch of validation check results.
+    
+    Args:
+        results: Check results exposing check_name and passed
+    """
+    for result in results:
+        _validation_check_counter(result.check_name, _PASS if result.passed else _FAIL).inc()
+
+
+def record_validation_request(source_type: str):
+    """
+    Record validation request by source type.
     
-    @staticmethod
-    def record_validation_request(source_type: str):
-        """
-        Record validation request by source type.
-        
-        Args:
-            source_type: Type of input source (json, excel, yaml)
-        """
-        validation_requests_total.labels(
-            source_type=source_type
-        ).inc()
+    Args:
+        source_type: Type of input source (json, excel, yaml)
+    """
+    _validation_request_counter(source_type).inc()
+
+
+def record_file_upload(file_type: str, success: bool):
+    """
+    Record file upload.
     
-    @staticmethod
-    def record_file_upload(file_type: str, success: bool):
-        """
-        Record file upload.
-        
-        Args:
-            file_type: File extension (xlsx, yaml, yml)
-            success: Whether upload was successful
-        """
-        status = "success" if success else "error"
-        file_uploads_total.labels(
-            file_type=file_type,
-            status=status
-        ).inc()
+    Args:
+        file_type: File extension (xlsx, yaml, yml)
+        success: Whether upload was successful
+    """
+    _file_upload_counter(file_type, _SUCCESS if success else _ERROR).inc()
+
+
+def set_app_version(version: str):
+    """
+    Set application version metric.
     
-    @staticmethod
-    def set_app_version(version: str):
-        """
-        Set application version metric.
-        
-        Args:
-            version: Application version string
-        """
-        app_info.labels(version=version).set(1)
+    Args:
+        version: Application version string
+    """
+    app_info.labels(version=version).set(1)
+
+
+class MetricsCollector:
+    """
+    Namespace kept for callers using metrics.record_*; the recorders are
+    plain module-level functions.
+    """
+    record_request = staticmethod(record_request)
+    record_validation_check = staticmethod(record_validation_check)
+    record_validation_checks = staticmethod(record_validation_checks)
+    record_validation_request = staticmethod(record_validation_request)
+    record_file_upload = staticmethod(record_file_upload)
+    set_app_version = staticmethod(set_app_version)
 
 
 def get_metrics() -> Response:
@@ -1,89 +1,141 @@
 """
 Middleware for request/response logging and metrics collection.
 """
+import logging
 import time
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from typing import Callable
+from typing import Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .logging_config import logger, set_request_id, clear_request_id
+from .metrics import record_request
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+def _user_agent(scope: Scope) -> Optional[str]:
+    """Return the User-Agent header without building a Headers mapping."""
+    for name, value in scope["headers"]:
+        if name == b"user-agent":
+            return value.decode("latin-1")
+    return None
+
+
+def _route_label(scope: Scope) -> str:
+    """
+    Return the matched route template for metrics labels.
+    
+    Raw paths would create a new Prometheus series for every 404 or
+    scanner probe, so requests that matched no route share one label.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    
+    # Plain Starlette routes (e.g. /docs, /openapi.json) only record the
+    # matched endpoint, so look its template up in the router
+    endpoint = scope.get("endpoint")
+    if endpoint is not None:
+        for candidate in scope["app"].router.routes:
+            if getattr(candidate, "endpoint", None) is endpoint:
+                return candidate.path
+    return "unmatched"
+
+
+class LoggingMiddleware:
     """
     Middleware that logs all HTTP requests and responses.
     Tracks request duration and adds request IDs for tracing.
+    
+    Implemented as plain ASGI middleware rather than BaseHTTPMiddleware,
+    which avoids wrapping every request in an extra task and stream.
     """
     
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and response with logging.
         
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
-        
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Generate and set request ID
         request_id = set_request_id()
         
         # Add request ID to request state for access in endpoints
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
         
-        # Start timer
-        start_time = time.time()
+        # Request fields shared by every log line for this request
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        log_extra = {"method": method, "path": path}
         
-        # Log incoming request
-        logger.info(
-            "Request started",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "client_host": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent"),
-            }
-        )
+        # Skip building INFO records entirely when that level is filtered out
+        info_enabled = logger.isEnabledFor(logging.INFO)
         
-        # Process request
-        try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Log response
+        # Start timer (monotonic, integer nanoseconds)
+        start_ns = time.perf_counter_ns()
+        
+        # Log incoming request
+        if info_enabled:
             logger.info(
-                "Request completed",
+                "Request started",
                 extra={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_ms": round(duration_ms, 2),
+                    **log_extra,
+                    "client_host": client[0] if client else None,
+                    "user_agent": _user_agent(scope),
                 }
             )
+        
+        status_code = None
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+                
+                record_request(method, _route_label(scope), status_code, (time.perf_counter_ns() - start_ns) / 1e9)
+            await send(message)
+        
+        # Process request
+        try:
+            await self.app(scope, receive, send_wrapper)
             
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            
-            return response
-            
+            # Log response
+            if info_enabled:
+                logger.info(
+                    "Request completed",
+                    extra={
+                        **log_extra,
+                        "status_code": status_code,
+                        "duration_ms": (time.perf_counter_ns() - start_ns) / 1_000_000,
+                    }
+                )
+        
         except Exception as e:
             # Calculate duration even for errors
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            
+            # Errors raised before a response started become a 500 upstream
+            if status_code is None:
+                record_request(method, _route_label(scope), 500, duration_ms / 1000)
             
             # Log error
             logger.error(
                 "Request failed",
                 extra={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "duration_ms": round(duration_ms, 2),
+                    **log_extra,
+                    "duration_ms": duration_ms,
                     "error": str(e),
                     "error_type": type(e).__name__,
                 },
@@ -92,7 +144,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             
             # Re-raise exception to be handled by FastAPI
             raise
-            
+        
         finally:
             # Clean up request ID from context
             clear_request_id()
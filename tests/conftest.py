@@ -0,0 +1,43 @@
+"""
+Shared fixtures for Travel Readiness Sentinel tests.
+"""
+from datetime import date
+
+import pytest
+
+from src.core.model import Flight, Hotel, TripContext, Itinerary
+
+
+@pytest.fixture(scope="session")
+def base_itinerary():
+    """
+    Perfect Tokyo itinerary, validated once per session.
+
+    Shared between tests, so tests that modify the itinerary must work
+    on a model_copy(deep=True) of it.
+    """
+    return Itinerary(
+        trip_details=TripContext(
+            destination="Tokyo",
+            start_date=date(2025, 12, 20),
+            end_date=date(2025, 12, 27),
+            total_duration_days=7
+        ),
+        flights=[
+            Flight(
+                type="arrival",
+                flight_number="JL041",
+                arrival_date=date(2025, 12, 20)
+            ),
+            Flight(
+                type="departure",
+                flight_number="JL042",
+                departure_date=date(2025, 12, 27)
+            )
+        ],
+        accommodation=Hotel(
+            hotel_name="Shinjuku Granbell",
+            check_in=date(2025, 12, 20),
+            check_out=date(2025, 12, 27)
+        )
+    )
@@ -0,0 +1,23 @@
+"""
+Shared helpers for Travel Readiness Sentinel tests.
+"""
+from openpyxl import Workbook
+
+
+def write_itinerary_workbook(data, target):
+    """
+    Write column data to a 'Travel Itinerary' sheet.
+
+    Uses openpyxl's write-only mode directly rather than going through
+    pandas, which is much faster for these small fixture workbooks.
+
+    Args:
+        data: Mapping of column header to a list of cell values
+        target: File path or binary file object to save to
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Travel Itinerary')
+    sheet.append(list(data))
+    for row in zip(*data.values()):
+        sheet.append(row)
+    workbook.save(target)
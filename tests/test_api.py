@@ -1,52 +1,88 @@
 """
 API endpoint tests for Travel Readiness Sentinel.
-Tests all FastAPI endpoints using TestClient.
+Tests all FastAPI endpoints through an httpx AsyncClient bound to the ASGI app.
 """
+import copy
+import io
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from pathlib import Path
-import tempfile
-import pandas as pd
 
 from src.api import app
+from tests.helpers import write_itinerary_workbook
+
+
+# Valid itinerary payload; fixtures hand out deep copies so tests may mutate them
+VALID_ITINERARY = {
+    "trip_details": {
+        "destination": "Tokyo",
+        "start_date": "2025-04-10",
+        "end_date": "2025-04-17",
+        "total_duration_days": 7
+    },
+    "flights": [
+        {
+            "type": "arrival",
+            "flight_number": "NH110",
+            "arrival_date": "2025-04-10"
+        },
+        {
+            "type": "departure",
+            "flight_number": "NH111",
+            "departure_date": "2025-04-17"
+        }
+    ],
+    "accommodation": {
+        "hotel_name": "Park Hyatt Tokyo",
+        "check_in": "2025-04-10",
+        "check_out": "2025-04-17"
+    }
+}
+
+# Payloads /validate must reject with 422
+MALFORMED_ITINERARY = {
+    "trip_details": {
+        "destination": "Paris"
+        # Missing required fields
+    }
+}
+SHORT_FLIGHT_NUMBER_ITINERARY = copy.deepcopy(VALID_ITINERARY)
+SHORT_FLIGHT_NUMBER_ITINERARY["flights"][0]["flight_number"] = "AB"  # Too short
+
+
+# Endpoint tests run on the anyio pytest plugin (installed with FastAPI)
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
 
 
 class TestAPIEndpoints:
     """Test suite for API endpoints."""
     
-    @pytest.fixture
-    def client(self):
-        """FastAPI test client."""
-        return TestClient(app)
+    @pytest.fixture(scope="session")
+    async def client(self):
+        """Async HTTP client calling the ASGI app in-process."""
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            yield client
+    
+    @pytest.fixture(scope="session")
+    def openapi_spec(self):
+        """
+        OpenAPI schema, generated once per session. FastAPI keeps it on
+        app.openapi_schema, so /openapi.json and /docs serve the cached copy.
+        """
+        return app.openapi()
     
     @pytest.fixture
     def valid_itinerary_data(self):
         """Valid itinerary data for testing."""
-        return {
-            "trip_details": {
-                "destination": "Tokyo",
-                "start_date": "2025-04-10",
-                "end_date": "2025-04-17",
-                "total_duration_days": 7
-            },
-            "flights": [
-                {
-                    "type": "arrival",
-                    "flight_number": "NH110",
-                    "arrival_date": "2025-04-10"
-                },
-                {
-                    "type": "departure",
-                    "flight_number": "NH111",
-                    "departure_date": "2025-04-17"
-                }
-            ],
-            "accommodation": {
-                "hotel_name": "Park Hyatt Tokyo",
-                "check_in": "2025-04-10",
-                "check_out": "2025-04-17"
-            }
-        }
+        return copy.deepcopy(VALID_ITINERARY)
     
     @pytest.fixture
     def invalid_itinerary_data(self):
@@ -77,9 +113,51 @@ class TestAPIEndpoints:
             }
         }
     
-    def test_root_endpoint(self, client):
+    @pytest.fixture(scope="session")
+    def excel_upload_bytes(self):
+        """Valid Excel itinerary workbook, rendered once per session."""
+        excel_data = {
+            'Field': [
+                'Trip Destination',
+                'Trip Start Date', 
+                'Trip End Date',
+                'Total Duration (Days)',
+                '',
+                'Arrival Flight Number',
+                'Arrival Date',
+                '',
+                'Departure Flight Number', 
+                'Departure Date',
+                '',
+                'Hotel Name',
+                'Hotel Check-in Date',
+                'Hotel Check-out Date'
+            ],
+            'Value': [
+                'Tokyo',
+                '2025-04-10',
+                '2025-04-17', 
+                7,
+                '',
+                'NH110',
+                '2025-04-10',
+                '',
+                'NH111',
+                '2025-04-17',
+                '',
+                'Park Hyatt Tokyo',
+                '2025-04-10',
+                '2025-04-17'
+            ]
+        }
+        
+        buffer = io.BytesIO()
+        write_itinerary_workbook(excel_data, buffer)
+        return buffer.getvalue()
+    
+    async def test_root_endpoint(self, client):
         """Test GET / returns API information."""
-        response = client.get("/")
+        response = await client.get("/")
         
         assert response.status_code == 200
         data = response.json()
@@ -90,9 +168,9 @@ class TestAPIEndpoints:
         assert data["documentation_url"] == "/docs"
         assert data["health_check_url"] == "/health"
     
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test GET /health returns healthy status."""
-        response = client.get("/health")
+        response = await client.get("/health")
         
         assert response.status_code == 200
         data = response.json()
@@ -102,10 +180,41 @@ class TestAPIEndpoints:
         assert "timestamp" in data
         assert "checks" in data
         assert data["checks"]["api"] == "operational"
+        assert data["uptime_seconds"] >= 0
+    
+    async def test_request_id_header_and_metrics(self, client):
+        """Test responses carry X-Request-ID and requests are counted."""
+        response = await client.get("/health")
+        
+        assert response.status_code == 200
+        assert response.headers.get("X-Request-ID")
+        
+        metrics_response = await client.get("/metrics")
+        assert 'http_requests_total{endpoint="/health",method="GET",status_code="200"}' in metrics_response.text
     
-    def test_validate_valid_itinerary(self, client, valid_itinerary_data):
+    async def test_metrics_label_unmatched_paths(self, client):
+        """Test that unknown paths share one metrics label instead of one each."""
+        response = await client.get("/no-such-path/12345")
+        
+        assert response.status_code == 404
+        
+        metrics_response = await client.get("/metrics")
+        assert 'endpoint="/no-such-path/12345"' not in metrics_response.text
+        assert 'http_requests_total{endpoint="unmatched",method="GET",status_code="404"}' in metrics_response.text
+    
+    async def test_metrics_label_docs_route(self, client):
+        """Test that plain Starlette routes such as /docs keep their own label."""
+        response = await client.get("/docs")
+        
+        assert response.status_code == 200
+        
+        metrics_response = await client.get("/metrics")
+        assert 'http_requests_total{endpoint="/docs",method="GET",status_code="200"}' in metrics_response.text
+        assert 'http_requests_total{endpoint="unmatched",method="GET",status_code="200"}' not in metrics_response.text
+    
+    async def test_validate_valid_itinerary(self, client, valid_itinerary_data):
         """Test POST /validate with valid itinerary data."""
-        response = client.post("/validate", json=valid_itinerary_data)
+        response = await client.post("/validate", json=valid_itinerary_data)
         
         assert response.status_code == 200
         data = response.json()
@@ -124,9 +233,9 @@ class TestAPIEndpoints:
             assert "check_name" in check
             assert "message" in check
     
-    def test_validate_invalid_itinerary(self, client, invalid_itinerary_data):
+    async def test_validate_invalid_itinerary(self, client, invalid_itinerary_data):
         """Test POST /validate with invalid itinerary (business logic failures)."""
-        response = client.post("/validate", json=invalid_itinerary_data)
+        response = await client.post("/validate", json=invalid_itinerary_data)
         
         assert response.status_code == 200
         data = response.json()
@@ -143,16 +252,14 @@ class TestAPIEndpoints:
         for check in data["checks"]:
             assert check["passed"] is False
     
-    def test_validate_malformed_data(self, client):
-        """Test POST /validate with malformed data (Pydantic validation error)."""
-        malformed_data = {
-            "trip_details": {
-                "destination": "Paris"
-                # Missing required fields
-            }
-        }
-        
-        response = client.post("/validate", json=malformed_data)
+    @pytest.mark.parametrize(
+        "payload",
+        [MALFORMED_ITINERARY, SHORT_FLIGHT_NUMBER_ITINERARY],
+        ids=["missing_fields", "short_flight_number"]
+    )
+    async def test_validate_422(self, client, payload):
+        """Test POST /validate rejects malformed data (Pydantic validation error)."""
+        response = await client.post("/validate", json=payload)
         
         assert response.status_code == 422
         data = response.json()
@@ -160,108 +267,90 @@ class TestAPIEndpoints:
         # FastAPI returns 'detail' key for validation errors
         assert "detail" in data
     
-    def test_validate_invalid_flight_number(self, client, valid_itinerary_data):
-        """Test POST /validate with invalid flight number."""
-        valid_itinerary_data["flights"][0]["flight_number"] = "AB"  # Too short
+    @pytest.mark.excel
+    async def test_upload_excel_file(self, client, excel_upload_bytes):
+        """Test POST /upload with Excel file."""
+        response = await client.post(
+            "/upload",
+            files={"file": ("itinerary.xlsx", excel_upload_bytes, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
+        )
         
-        response = client.post("/validate", json=valid_itinerary_data)
+        assert response.status_code == 200
+        data = response.json()
         
-        assert response.status_code == 422
+        assert data["status"] == "success"
+        assert data["destination"] == "Tokyo"
+        assert data["passed_checks"] == 3
     
-    def test_upload_excel_file(self, client):
-        """Test POST /upload with Excel file."""
-        # Create temporary Excel file
-        excel_data = {
-            'Field': [
-                'Trip Destination',
-                'Trip Start Date', 
-                'Trip End Date',
-                'Total Duration (Days)',
-                '',
-                'Arrival Flight Number',
-                'Arrival Date',
-                '',
-                'Departure Flight Number', 
-                'Departure Date',
-                '',
-                'Hotel Name',
-                'Hotel Check-in Date',
-                'Hotel Check-out Date'
-            ],
-            'Value': [
-                'Tokyo',
-                '2025-04-10',
-                '2025-04-17', 
-                7,
-                '',
-                'NH110',
-                '2025-04-10',
-                '',
-                'NH111',
-                '2025-04-17',
-                '',
-                'Park Hyatt Tokyo',
-                '2025-04-10',
-                '2025-04-17'
-            ]
-        }
+    async def test_upload_yaml_file(self, client):
+        """Test POST /upload with YAML file."""
+        yaml_content = b"""
+trip_details:
+  destination: "Tokyo"
+  start_date: "2025-04-10"
+  end_date: "2025-04-17"
+  total_duration_days: 7
+
+flights:
+  - type: "arrival"
+    flight_number: "NH110"
+    arrival_date: "2025-04-10"
+  - type: "departure"
+    flight_number: "NH111"
+    departure_date: "2025-04-17"
+
+accommodation:
+  hotel_name: "Park Hyatt Tokyo"
+  check_in: "2025-04-10"
+  check_out: "2025-04-17"
+"""
+        response = await client.post(
+            "/upload",
+            files={"file": ("itinerary.yaml", yaml_content, "application/x-yaml")}
+        )
         
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
-            df = pd.DataFrame(excel_data)
-            df.to_excel(temp_file.name, sheet_name='Travel Itinerary', index=False)
-            temp_path = temp_file.name
+        assert response.status_code == 200
+        data = response.json()
         
-        try:
-            # Upload file
-            with open(temp_path, 'rb') as f:
-                response = client.post(
-                    "/upload",
-                    files={"file": ("itinerary.xlsx", f, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
-                )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            assert data["status"] == "success"
-            assert data["destination"] == "Tokyo"
-            assert data["passed_checks"] == 3
-            
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        assert data["status"] == "success"
+        assert data["destination"] == "Tokyo"
+        assert data["passed_checks"] == 3
     
-    def test_upload_unsupported_file_type(self, client):
+    async def test_upload_unsupported_file_type(self, client):
         """Test POST /upload with unsupported file type."""
-        # Create a text file
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as temp_file:
-            temp_file.write(b"Some text content")
-            temp_path = temp_file.name
+        response = await client.post(
+            "/upload",
+            files={"file": ("test.txt", b"Some text content", "text/plain")}
+        )
+        
+        assert response.status_code == 400
+        data = response.json()
+        assert "Unsupported file type" in data["detail"]
+    
+    async def test_upload_file_too_large(self, client, monkeypatch):
+        """Test POST /upload rejects files over the size limit."""
+        monkeypatch.setattr("src.api._MAX_UPLOAD_BYTES", 10)
+        
+        response = await client.post(
+            "/upload",
+            files={"file": ("itinerary.yaml", b"trip_details: {}\n", "application/x-yaml")}
+        )
         
-        try:
-            with open(temp_path, 'rb') as f:
-                response = client.post(
-                    "/upload",
-                    files={"file": ("test.txt", f, "text/plain")}
-                )
-            
-            assert response.status_code == 400
-            data = response.json()
-            assert "Unsupported file type" in data["detail"]
-            
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        assert response.status_code == 413
+        assert "File too large" in response.json()["detail"]
     
     # Note: CORS is configured but TestClient doesn't simulate CORS middleware
     # CORS should be tested with actual HTTP requests or browser testing
     
-    def test_openapi_docs_available(self, client):
+    async def test_openapi_docs_available(self, client, openapi_spec):
         """Test that OpenAPI documentation is accessible."""
-        response = client.get("/docs")
+        response = await client.get("/docs")
         assert response.status_code == 200
         
-        response = client.get("/openapi.json")
+        response = await client.get("/openapi.json")
         assert response.status_code == 200
+        assert response.json()["paths"].keys() == openapi_spec["paths"].keys()
         
-        openapi_spec = response.json()
         assert "openapi" in openapi_spec
         assert "paths" in openapi_spec
         assert "/validate" in openapi_spec["paths"]
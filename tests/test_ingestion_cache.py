@@ -0,0 +1,29 @@
+import io
+import pytest
+from src.ingestion.yaml import YAML_INGESTION, YAMLIngestion
+
+
+class TestCachedParse:
+    """Test parse result caching for file object sources"""
+    
+    @pytest.fixture(autouse=True)
+    def cold_cache(self):
+        """Start and finish each test with an empty parse cache"""
+        YAMLIngestion.parse.cache_clear()
+        yield
+        YAMLIngestion.parse.cache_clear()
+    
+    def test_text_stream_parsed_without_caching(self):
+        """Test that text streams are parsed instead of failing to hash"""
+        assert YAML_INGESTION.parse(io.StringIO("a: 1")) == {'a': 1}
+        assert YAML_INGESTION.parse(io.StringIO("a: 2")) == {'a': 2}
+    
+    def test_binary_stream_rewound_and_cached(self):
+        """Test that byte-identical streams share one cached parse"""
+        first = io.BytesIO(b"a: 1")
+        assert YAML_INGESTION.parse(first) == {'a': 1}
+        
+        # A cache hit hashes the stream and leaves it at its start
+        second = io.BytesIO(b"a: 1")
+        assert YAML_INGESTION.parse(second) == {'a': 1}
+        assert second.tell() == 0
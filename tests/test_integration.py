@@ -1,23 +1,10 @@
 import pytest
-import yaml
-import tempfile
-import os
-from datetime import date
-from unittest.mock import patch
-from io import StringIO
-import sys
 from src.core.model import Itinerary
-from src.core.validation import get_all_checks
 from src import __main__ as main
 
 
-class TestMainIntegration:
-    """Integration tests for the main application"""
-    
-    @pytest.fixture
-    def valid_yaml_content(self):
-        """Valid YAML content for testing"""
-        return """
+# Itinerary that passes every check
+VALID_YAML = """
 trip_details:
   destination: "Tokyo"
   start_date: "2025-12-20"
@@ -38,11 +25,9 @@ accommodation:
   check_in: "2025-12-20"
   check_out: "2025-12-27"
 """
-    
-    @pytest.fixture
-    def problematic_yaml_content(self):
-        """Problematic YAML content for testing failures"""
-        return """
+
+# Well-formed itinerary that fails all three checks
+PROBLEMATIC_YAML = """
 trip_details:
   destination: "Tokyo"
   start_date: "2025-12-20"
@@ -63,11 +48,9 @@ accommodation:
   check_in: "2025-12-20"
   check_out: "2025-12-26"
 """
-    
-    @pytest.fixture
-    def invalid_yaml_content(self):
-        """Invalid YAML content for testing validation errors"""
-        return """
+
+# Itinerary rejected by model validation
+INVALID_YAML = """
 trip_details:
   destination: "Tokyo"
   start_date: "2025-12-20"
@@ -84,102 +67,104 @@ accommodation:
   check_in: "2025-12-20"
   check_out: "2025-12-27"
 """
+
+
+@pytest.fixture(scope="module")
+def yaml_file_factory(tmp_path_factory):
+    """Write each distinct YAML body to disk once and reuse the file"""
+    directory = tmp_path_factory.mktemp("itineraries")
+    paths = {}
     
-    def create_temp_yaml_file(self, content):
-        """Helper to create temporary YAML file"""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-        temp_file.write(content)
-        temp_file.close()
-        return temp_file.name
+    def factory(content):
+        path = paths.get(content)
+        if path is None:
+            path = directory / f"itinerary_{len(paths)}.yaml"
+            path.write_text(content, encoding='utf-8')
+            paths[content] = path
+        return path
     
-    def test_load_itinerary_valid_file(self, valid_yaml_content):
+    return factory
+
+
+class TestMainIntegration:
+    """Integration tests for the main application"""
+    
+    def test_load_itinerary_valid_file(self, yaml_file_factory):
         """Test loading a valid itinerary file"""
-        temp_file = self.create_temp_yaml_file(valid_yaml_content)
+        temp_file = str(yaml_file_factory(VALID_YAML))
         
-        try:
-            itinerary = main.load_itinerary(temp_file)
-            
-            assert isinstance(itinerary, Itinerary)
-            assert itinerary.trip_details.destination == "Tokyo"
-            assert len(itinerary.flights) == 2
-            assert itinerary.accommodation.hotel_name == "Shinjuku Granbell"
-        finally:
-            os.unlink(temp_file)
+        itinerary = main.load_itinerary(temp_file)
+        
+        assert isinstance(itinerary, Itinerary)
+        assert itinerary.trip_details.destination == "Tokyo"
+        assert len(itinerary.flights) == 2
+        assert itinerary.accommodation.hotel_name == "Shinjuku Granbell"
     
-    def test_load_itinerary_file_not_found(self, capsys):
-        """Test loading non-existent file"""
-        with pytest.raises(SystemExit) as exc_info:
-            main.load_itinerary("nonexistent_file.yaml")
+    def test_main_successful_validation(self, capsys, yaml_file_factory):
+        """Test main function with successful validation"""
+        temp_file = str(yaml_file_factory(VALID_YAML))
+        
+        # Should complete normally without SystemExit
+        main.main(['--itinerary', temp_file])
         
-        assert exc_info.value.code == 1
         captured = capsys.readouterr()
-        assert "Error: File nonexistent_file.yaml not found." in captured.out
+        assert "🔍 Ingesting Itinerary Data..." in captured.out
+        assert "✈️  Validating Trip to Tokyo..." in captured.out
+        assert "🎉 TRSS Status: READY FOR DEPARTURE" in captured.out
     
-    def test_load_itinerary_validation_error(self, invalid_yaml_content, capsys):
-        """Test loading file with validation errors"""
-        temp_file = self.create_temp_yaml_file(invalid_yaml_content)
+    def test_main_fail_fast(self, capsys, yaml_file_factory):
+        """Test main function stops at the first failed check with --fail-fast"""
+        temp_file = str(yaml_file_factory(PROBLEMATIC_YAML))
         
-        try:
-            with pytest.raises(SystemExit) as exc_info:
-                main.load_itinerary(temp_file)
-            
-            assert exc_info.value.code == 1
-            captured = capsys.readouterr()
-            assert "Data Integrity Error:" in captured.out
-        finally:
-            os.unlink(temp_file)
-    
-    @patch('sys.argv', ['main.py', '--itinerary', 'test_itinerary.yaml'])
-    def test_main_successful_validation(self, valid_yaml_content, capsys):
-        """Test main function with successful validation"""
-        temp_file = self.create_temp_yaml_file(valid_yaml_content)
+        with pytest.raises(SystemExit) as exc_info:
+            main.main(['--itinerary', temp_file, '--fail-fast'])
         
-        try:
-            with patch('sys.argv', ['main.py', '--itinerary', temp_file]):
-                # Should complete normally without SystemExit
-                main.main()
-                
-                captured = capsys.readouterr()
-                assert "🔍 Ingesting Itinerary Data..." in captured.out
-                assert "✈️  Validating Trip to Tokyo..." in captured.out
-                assert "🎉 TRSS Status: READY FOR DEPARTURE" in captured.out
-        finally:
-            os.unlink(temp_file)
-    
-    @patch('sys.argv', ['main.py', '--itinerary', 'test_itinerary.yaml'])
-    def test_main_failed_validation(self, problematic_yaml_content, capsys):
-        """Test main function with failed validation"""
-        temp_file = self.create_temp_yaml_file(problematic_yaml_content)
+        assert exc_info.value.code == 1
         
-        try:
-            with patch('sys.argv', ['main.py', '--itinerary', temp_file]):
-                with pytest.raises(SystemExit) as exc_info:
-                    main.main()
-                
-                # Should exit with code 1 (failure)
-                assert exc_info.value.code == 1
-                
-                captured = capsys.readouterr()
-                assert "🔍 Ingesting Itinerary Data..." in captured.out
-                assert "✈️  Validating Trip to Tokyo..." in captured.out
-                assert "🚨 TRSS Status: GROUNDED (3 Critical Errors Found)" in captured.out
-        finally:
-            os.unlink(temp_file)
+        captured = capsys.readouterr()
+        assert captured.out.count("❌ [FAIL]") == 1
+        assert "🚨 TRSS Status: GROUNDED (1 Critical Errors Found)" in captured.out
     
-    def test_main_missing_required_argument(self, capsys):
-        """Test main function without required --itinerary argument"""
-        with patch('sys.argv', ['main.py']):
-            with pytest.raises(SystemExit) as exc_info:
-                main.main()
-            
-            # ArgumentParser exits with code 2 for missing required arguments
-            assert exc_info.value.code == 2
+    @pytest.mark.parametrize("content, argv, exit_code, fragment", [
+        pytest.param(
+            None, ['--itinerary', 'nonexistent_file.yaml'], 1,
+            "Error: File nonexistent_file.yaml not found.",
+            id="file-not-found"
+        ),
+        pytest.param(
+            INVALID_YAML, [], 1,
+            "Data Integrity Error:",
+            id="validation-error"
+        ),
+        pytest.param(
+            PROBLEMATIC_YAML, [], 1,
+            "🚨 TRSS Status: GROUNDED (3 Critical Errors Found)",
+            id="failed-checks"
+        ),
+        # ArgumentParser exits with code 2 for missing required arguments
+        pytest.param(
+            None, [], 2,
+            "the following arguments are required: --itinerary",
+            id="missing-itinerary-argument"
+        ),
+    ])
+    def test_main_exit_behaviors(self, content, argv, exit_code, fragment, capsys, yaml_file_factory):
+        """Test main function exit codes and messages for failing runs"""
+        if content is not None:
+            argv = ['--itinerary', str(yaml_file_factory(content)), *argv]
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main.main(argv)
+        
+        assert exc_info.value.code == exit_code
+        captured = capsys.readouterr()
+        assert fragment in captured.out + captured.err
 
 
 class TestEndToEndScenarios:
     """End-to-end testing scenarios"""
     
-    def test_perfect_tokyo_trip(self, capsys):
+    def test_perfect_tokyo_trip(self, capsys, yaml_file_factory):
         """Test a perfect Tokyo trip scenario"""
         yaml_content = """
 trip_details:
@@ -203,22 +188,16 @@ accommodation:
   check_out: "2025-03-22"
 """
         
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-        temp_file.write(yaml_content)
-        temp_file.close()
+        temp_file = str(yaml_file_factory(yaml_content))
+        
+        # Should complete normally without SystemExit
+        main.main(['--itinerary', temp_file])
         
-        try:
-            with patch('sys.argv', ['main.py', '--itinerary', temp_file.name]):
-                # Should complete normally without SystemExit
-                main.main()
-                
-                captured = capsys.readouterr()
-                assert "🎉 TRSS Status: READY FOR DEPARTURE" in captured.out
-                assert captured.out.count("✅ [PASS]") == 3
-        finally:
-            os.unlink(temp_file.name)
+        captured = capsys.readouterr()
+        assert "🎉 TRSS Status: READY FOR DEPARTURE" in captured.out
+        assert captured.out.count("✅ [PASS]") == 3
     
-    def test_business_trip_with_early_departure(self, capsys):
+    def test_business_trip_with_early_departure(self, capsys, yaml_file_factory):
         """Test business trip where departure is before trip officially ends"""
         yaml_content = """
 trip_details:
@@ -242,24 +221,18 @@ accommodation:
   check_out: "2025-06-15"
 """
         
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-        temp_file.write(yaml_content)
-        temp_file.close()
+        temp_file = str(yaml_file_factory(yaml_content))
         
-        try:
-            with patch('sys.argv', ['main.py', '--itinerary', temp_file.name]):
-                with pytest.raises(SystemExit) as exc_info:
-                    main.main()
-                
-                assert exc_info.value.code == 1  # Failure
-                captured = capsys.readouterr()
-                assert "🚨 TRSS Status: GROUNDED" in captured.out
-                assert "Exit Strategy Alignment" in captured.out
-                assert "❌ [FAIL]" in captured.out
-        finally:
-            os.unlink(temp_file.name)
+        with pytest.raises(SystemExit) as exc_info:
+            main.main(['--itinerary', temp_file])
+        
+        assert exc_info.value.code == 1  # Failure
+        captured = capsys.readouterr()
+        assert "🚨 TRSS Status: GROUNDED" in captured.out
+        assert "Exit Strategy Alignment" in captured.out
+        assert "❌ [FAIL]" in captured.out
     
-    def test_extended_hotel_stay(self, capsys):
+    def test_extended_hotel_stay(self, capsys, yaml_file_factory):
         """Test scenario where hotel booking extends beyond trip dates"""
         yaml_content = """
 trip_details:
@@ -283,17 +256,11 @@ accommodation:
   check_out: "2025-09-07"
 """
         
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-        temp_file.write(yaml_content)
-        temp_file.close()
+        temp_file = str(yaml_file_factory(yaml_content))
         
-        try:
-            with patch('sys.argv', ['main.py', '--itinerary', temp_file.name]):
-                # Should pass - extra hotel nights are okay
-                main.main()
-                
-                captured = capsys.readouterr()
-                assert "🎉 TRSS Status: READY FOR DEPARTURE" in captured.out
-                assert captured.out.count("✅ [PASS]") == 3
-        finally:
-            os.unlink(temp_file.name)
\ No newline at end of file
+        # Should pass - extra hotel nights are okay
+        main.main(['--itinerary', temp_file])
+        
+        captured = capsys.readouterr()
+        assert "🎉 TRSS Status: READY FOR DEPARTURE" in captured.out
+        assert captured.out.count("✅ [PASS]") == 3
\ No newline at end of file
@@ -7,81 +7,60 @@ from src.core.model import Flight, Hotel, TripContext, Itinerary
 class TestFlight:
     """Test Flight model validation and behavior"""
     
-    def test_valid_arrival_flight(self):
-        """Test creating a valid arrival flight"""
-        flight = Flight(
-            type="arrival",
-            flight_number="JL041",
-            arrival_date=date(2025, 12, 20)
-        )
-        assert flight.type == "arrival"
-        assert flight.flight_number == "JL041"
-        assert flight.flight_date == date(2025, 12, 20)
-    
-    def test_valid_departure_flight(self):
-        """Test creating a valid departure flight"""
-        flight = Flight(
-            type="departure",
-            flight_number="JL042",
-            departure_date=date(2025, 12, 27)
-        )
-        assert flight.type == "departure"
-        assert flight.flight_number == "JL042"
-        assert flight.flight_date == date(2025, 12, 27)
-    
-    def test_arrival_flight_missing_arrival_date(self):
-        """Test that arrival flights require arrival_date"""
-        with pytest.raises(ValidationError, match="Arrival flights must have arrival_date"):
-            Flight(
-                type="arrival",
-                flight_number="JL041"
-            )
-    
-    def test_departure_flight_missing_departure_date(self):
-        """Test that departure flights require departure_date"""
-        with pytest.raises(ValidationError, match="Departure flights must have departure_date"):
-            Flight(
-                type="departure",
-                flight_number="JL042"
-            )
-    
-    def test_arrival_flight_with_departure_date(self):
-        """Test that arrival flights cannot have departure_date"""
-        with pytest.raises(ValidationError, match="Arrival flights should not have departure_date"):
-            Flight(
-                type="arrival",
-                flight_number="JL041",
-                arrival_date=date(2025, 12, 20),
-                departure_date=date(2025, 12, 27)
-            )
-    
-    def test_departure_flight_with_arrival_date(self):
-        """Test that departure flights cannot have arrival_date"""
-        with pytest.raises(ValidationError, match="Departure flights should not have arrival_date"):
-            Flight(
-                type="departure",
-                flight_number="JL042",
-                arrival_date=date(2025, 12, 20),
-                departure_date=date(2025, 12, 27)
-            )
-    
-    def test_invalid_flight_number(self):
-        """Test flight number validation"""
-        with pytest.raises(ValidationError, match="Invalid Flight Number"):
-            Flight(
-                type="arrival",
-                flight_number="JL",
-                arrival_date=date(2025, 12, 20)
-            )
-    
-    def test_flight_number_validation_passes(self):
-        """Test valid flight numbers pass validation"""
-        flight = Flight(
-            type="arrival",
-            flight_number="ABC123",
-            arrival_date=date(2025, 12, 20)
-        )
-        assert flight.flight_number == "ABC123"
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param(
+            dict(type="arrival", flight_number="JL041", arrival_date=date(2025, 12, 20)),
+            id="arrival"
+        ),
+        pytest.param(
+            dict(type="departure", flight_number="JL042", departure_date=date(2025, 12, 27)),
+            id="departure"
+        ),
+        pytest.param(
+            dict(type="arrival", flight_number="ABC123", arrival_date=date(2025, 12, 20)),
+            id="longer-flight-number"
+        ),
+    ])
+    def test_valid_flight(self, kwargs):
+        """Test creating valid flights"""
+        flight = Flight(**kwargs)
+        assert flight.type == kwargs["type"]
+        assert flight.flight_number == kwargs["flight_number"]
+        assert flight.flight_date == kwargs.get("arrival_date", kwargs.get("departure_date"))
+    
+    @pytest.mark.parametrize("kwargs, error", [
+        pytest.param(
+            dict(type="arrival", flight_number="JL041"),
+            "Arrival flights must have arrival_date",
+            id="arrival-missing-arrival-date"
+        ),
+        pytest.param(
+            dict(type="departure", flight_number="JL042"),
+            "Departure flights must have departure_date",
+            id="departure-missing-departure-date"
+        ),
+        pytest.param(
+            dict(type="arrival", flight_number="JL041",
+                 arrival_date=date(2025, 12, 20), departure_date=date(2025, 12, 27)),
+            "Arrival flights should not have departure_date",
+            id="arrival-with-departure-date"
+        ),
+        pytest.param(
+            dict(type="departure", flight_number="JL042",
+                 arrival_date=date(2025, 12, 20), departure_date=date(2025, 12, 27)),
+            "Departure flights should not have arrival_date",
+            id="departure-with-arrival-date"
+        ),
+        pytest.param(
+            dict(type="arrival", flight_number="JL", arrival_date=date(2025, 12, 20)),
+            "Invalid Flight Number",
+            id="short-flight-number"
+        ),
+    ])
+    def test_invalid_flight(self, kwargs, error):
+        """Test that inconsistent flights are rejected with a clear message"""
+        with pytest.raises(ValidationError, match=error):
+            Flight(**kwargs)
 
 
 class TestHotel:
@@ -1,15 +1,14 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
-from io import StringIO
-import sys
 from src.core.model import Flight, Hotel, TripContext, Itinerary
 from src.core.validation import (
     ReadinessCheck, 
     ArrivalAlignmentCheck, 
     DurationCoverageCheck, 
     DepartureAlignmentCheck,
-    get_all_checks
+    get_all_checks,
+    index_flights,
+    run_all_checks
 )
 
 
@@ -28,178 +27,68 @@ class TestReadinessCheck:
             check.run(None)
 
 
-class TestArrivalAlignmentCheck:
-    """Test arrival flight and hotel check-in alignment"""
-    
-    @pytest.fixture
-    def sample_itinerary(self):
-        """Sample itinerary for testing"""
-        return Itinerary(
-            trip_details=TripContext(
-                destination="Tokyo",
-                start_date=date(2025, 12, 20),
-                end_date=date(2025, 12, 27),
-                total_duration_days=7
-            ),
-            flights=[
-                Flight(
-                    type="arrival",
-                    flight_number="JL041",
-                    arrival_date=date(2025, 12, 20)
-                ),
-                Flight(
-                    type="departure",
-                    flight_number="JL042",
-                    departure_date=date(2025, 12, 27)
-                )
-            ],
-            accommodation=Hotel(
-                hotel_name="Shinjuku Granbell",
-                check_in=date(2025, 12, 20),
-                check_out=date(2025, 12, 27)
-            )
-        )
-    
-    def test_arrival_alignment_pass(self, sample_itinerary):
-        """Test arrival alignment when dates match"""
-        check = ArrivalAlignmentCheck("Arrival Date Alignment")
-        
-        result = check.run(sample_itinerary)
-        
-        assert result.passed is True
-        assert result.check_name == "Arrival Date Alignment"
-        assert "matches hotel check-in" in result.message
-    
-    def test_arrival_alignment_fail(self, sample_itinerary):
-        """Test arrival alignment when dates don't match"""
-        # Modify hotel check-in to be different from arrival
-        sample_itinerary.accommodation.check_in = date(2025, 12, 21)
-        
-        check = ArrivalAlignmentCheck("Arrival Date Alignment")
-        result = check.run(sample_itinerary)
-        
-        assert result.passed is False
-        assert "Flight lands on 2025-12-20" in result.message
-        assert "Hotel check-in is 2025-12-21" in result.message
+def _set_check_in(day):
+    return lambda itinerary: setattr(itinerary.accommodation, 'check_in', day)
 
 
-class TestDurationCoverageCheck:
-    """Test hotel duration coverage validation"""
-    
-    @pytest.fixture
-    def sample_itinerary(self):
-        """Sample itinerary for testing"""
-        return Itinerary(
-            trip_details=TripContext(
-                destination="Tokyo",
-                start_date=date(2025, 12, 20),
-                end_date=date(2025, 12, 27),
-                total_duration_days=7
-            ),
-            flights=[
-                Flight(
-                    type="arrival",
-                    flight_number="JL041",
-                    arrival_date=date(2025, 12, 20)
-                ),
-                Flight(
-                    type="departure",
-                    flight_number="JL042",
-                    departure_date=date(2025, 12, 27)
-                )
-            ],
-            accommodation=Hotel(
-                hotel_name="Shinjuku Granbell",
-                check_in=date(2025, 12, 20),
-                check_out=date(2025, 12, 27)
-            )
-        )
-    
-    def test_duration_coverage_pass(self, sample_itinerary):
-        """Test duration coverage when hotel covers full trip"""
-        check = DurationCoverageCheck("Full Accommodation Coverage")
-        
-        result = check.run(sample_itinerary)
-        
-        assert result.passed is True
-        assert "Hotel covers full trip duration" in result.message
-    
-    def test_duration_coverage_pass_extra_nights(self, sample_itinerary):
-        """Test duration coverage when hotel has extra nights"""
-        # Extend hotel checkout by one day
-        sample_itinerary.accommodation.check_out = date(2025, 12, 28)
-        
-        check = DurationCoverageCheck("Full Accommodation Coverage")
-        result = check.run(sample_itinerary)
-        
-        assert result.passed is True
-        assert "8 nights >= 7 nights" in result.message
-    
-    def test_duration_coverage_fail(self, sample_itinerary):
-        """Test duration coverage when hotel is too short"""
-        # Make hotel checkout one day early
-        sample_itinerary.accommodation.check_out = date(2025, 12, 26)
-        
-        check = DurationCoverageCheck("Full Accommodation Coverage")
-        result = check.run(sample_itinerary)
-        
-        assert result.passed is False
-        assert "Trip is 7 nights" in result.message
-        assert "hotel is only 6 nights" in result.message
+def _set_check_out(day):
+    return lambda itinerary: setattr(itinerary.accommodation, 'check_out', day)
 
 
-class TestDepartureAlignmentCheck:
-    """Test departure flight and trip end alignment"""
-    
-    @pytest.fixture
-    def sample_itinerary(self):
-        """Sample itinerary for testing"""
-        return Itinerary(
-            trip_details=TripContext(
-                destination="Tokyo",
-                start_date=date(2025, 12, 20),
-                end_date=date(2025, 12, 27),
-                total_duration_days=7
-            ),
-            flights=[
-                Flight(
-                    type="arrival",
-                    flight_number="JL041",
-                    arrival_date=date(2025, 12, 20)
-                ),
-                Flight(
-                    type="departure",
-                    flight_number="JL042",
-                    departure_date=date(2025, 12, 27)
-                )
-            ],
-            accommodation=Hotel(
-                hotel_name="Shinjuku Granbell",
-                check_in=date(2025, 12, 20),
-                check_out=date(2025, 12, 27)
-            )
-        )
-    
-    def test_departure_alignment_pass(self, sample_itinerary):
-        """Test departure alignment when dates match"""
-        check = DepartureAlignmentCheck("Exit Strategy Alignment")
-        
-        result = check.run(sample_itinerary)
-        
-        assert result.passed is True
-        assert "matches trip end date" in result.message
-    
-    def test_departure_alignment_fail(self, sample_itinerary):
-        """Test departure alignment when dates don't match"""
-        # Change departure flight date
-        sample_itinerary.flights[1].departure_date = date(2025, 12, 28)
-        
-        check = DepartureAlignmentCheck("Exit Strategy Alignment")
-        result = check.run(sample_itinerary)
-        
-        assert result.passed is False
-        assert "Trip ends on 2025-12-27" in result.message
-        assert "flight is 2025-12-28" in result.message
+def _set_departure(day):
+    return lambda itinerary: setattr(itinerary.flights[1], 'departure_date', day)
+
+
+@pytest.mark.parametrize("check_cls, check_name, mutate, expected, fragments", [
+    pytest.param(
+        ArrivalAlignmentCheck, "Arrival Date Alignment", None, True,
+        ["matches hotel check-in"],
+        id="arrival-pass"
+    ),
+    pytest.param(
+        ArrivalAlignmentCheck, "Arrival Date Alignment", _set_check_in(date(2025, 12, 21)), False,
+        ["Flight lands on 2025-12-20", "Hotel check-in is 2025-12-21"],
+        id="arrival-fail"
+    ),
+    pytest.param(
+        DurationCoverageCheck, "Full Accommodation Coverage", None, True,
+        ["Hotel covers full trip duration"],
+        id="duration-pass"
+    ),
+    pytest.param(
+        DurationCoverageCheck, "Full Accommodation Coverage", _set_check_out(date(2025, 12, 28)), True,
+        ["8 nights >= 7 nights"],
+        id="duration-pass-extra-nights"
+    ),
+    pytest.param(
+        DurationCoverageCheck, "Full Accommodation Coverage", _set_check_out(date(2025, 12, 26)), False,
+        ["Trip is 7 nights", "hotel is only 6 nights"],
+        id="duration-fail"
+    ),
+    pytest.param(
+        DepartureAlignmentCheck, "Exit Strategy Alignment", None, True,
+        ["matches trip end date"],
+        id="departure-pass"
+    ),
+    pytest.param(
+        DepartureAlignmentCheck, "Exit Strategy Alignment", _set_departure(date(2025, 12, 28)), False,
+        ["Trip ends on 2025-12-27", "flight is 2025-12-28"],
+        id="departure-fail"
+    ),
+])
+def test_check(base_itinerary, check_cls, check_name, mutate, expected, fragments):
+    """Test each readiness check against the base itinerary or a modified copy"""
+    itinerary = base_itinerary
+    if mutate is not None:
+        itinerary = base_itinerary.model_copy(deep=True)
+        mutate(itinerary)
+    
+    result = check_cls(check_name).run(itinerary)
+    
+    assert result.passed is expected
+    assert result.check_name == check_name
+    for fragment in fragments:
+        assert fragment in result.message
 
 
 class TestGetAllChecks:
@@ -246,46 +135,37 @@ class TestGetAllChecks:
 class TestIntegratedValidation:
     """Test integrated validation scenarios"""
     
-    def test_perfect_itinerary_all_pass(self):
+    def test_perfect_itinerary_all_pass(self, base_itinerary):
         """Test that a perfect itinerary passes all checks"""
-        itinerary = Itinerary(
-            trip_details=TripContext(
-                destination="Tokyo",
-                start_date=date(2025, 12, 20),
-                end_date=date(2025, 12, 27),
-                total_duration_days=7
-            ),
-            flights=[
-                Flight(
-                    type="arrival",
-                    flight_number="JL041",
-                    arrival_date=date(2025, 12, 20)
-                ),
-                Flight(
-                    type="departure",
-                    flight_number="JL042",
-                    departure_date=date(2025, 12, 27)
-                )
-            ],
-            accommodation=Hotel(
-                hotel_name="Shinjuku Granbell",
-                check_in=date(2025, 12, 20),
-                check_out=date(2025, 12, 27)
-            )
-        )
-        
         checks = get_all_checks()
-        failures = 0
-        
-        for check in checks:
-            result = check.run(itinerary)
-            if not result.passed:
-                failures += 1
+        failures = sum(not check.run(base_itinerary).passed for check in checks)
         
         assert failures == 0
     
-    def test_problematic_itinerary_all_fail(self):
+    def test_problematic_itinerary_all_fail(self, base_itinerary):
         """Test that a problematic itinerary fails all checks"""
+        itinerary = base_itinerary.model_copy(deep=True)
+        itinerary.flights[0].arrival_date = date(2025, 12, 21)  # Misaligned arrival
+        itinerary.flights[1].departure_date = date(2025, 12, 28)  # Misaligned departure
+        itinerary.accommodation.check_out = date(2025, 12, 26)  # Insufficient coverage
+        
+        checks = get_all_checks()
+        failures = sum(not check.run(itinerary).passed for check in checks)
+        
+        assert failures == 3
+    
+    def test_run_all_checks_in_check_order(self, base_itinerary):
+        """Test that run_all_checks returns one result per check in order"""
+        itinerary = base_itinerary.model_copy(deep=True)
+        itinerary.flights[0].arrival_date = date(2025, 12, 21)  # Misaligned arrival
+        
+        results = run_all_checks(itinerary)
+        
+        assert [r.check_name for r in results] == [c.name for c in get_all_checks()]
+        assert [r.passed for r in results] == [False, True, True]
+    
+    def test_index_flights_matches_scan(self):
+        """Test that checks give the same result with a prebuilt flight index"""
         itinerary = Itinerary(
             trip_details=TripContext(
                 destination="Tokyo",
@@ -294,30 +174,19 @@ class TestIntegratedValidation:
                 total_duration_days=7
             ),
             flights=[
-                Flight(
-                    type="arrival",
-                    flight_number="JL041",
-                    arrival_date=date(2025, 12, 21)  # Misaligned arrival
-                ),
-                Flight(
-                    type="departure",
-                    flight_number="JL042",
-                    departure_date=date(2025, 12, 28)  # Misaligned departure
-                )
+                Flight(type="arrival", flight_number="JL041", arrival_date=date(2025, 12, 20)),
+                Flight(type="arrival", flight_number="JL043", arrival_date=date(2025, 12, 21)),
+                Flight(type="departure", flight_number="JL042", departure_date=date(2025, 12, 27))
             ],
             accommodation=Hotel(
                 hotel_name="Shinjuku Granbell",
                 check_in=date(2025, 12, 20),
-                check_out=date(2025, 12, 26)  # Insufficient coverage
+                check_out=date(2025, 12, 27)
             )
         )
         
-        checks = get_all_checks()
-        failures = 0
-        
-        for check in checks:
-            result = check.run(itinerary)
-            if not result.passed:
-                failures += 1
+        flights_by_type = index_flights(itinerary)
+        assert flights_by_type['arrival'].flight_number == "JL041"
         
-        assert failures == 3
\ No newline at end of file
+        for check in get_all_checks():
+            assert check.run(itinerary, flights_by_type) == check.run(itinerary)